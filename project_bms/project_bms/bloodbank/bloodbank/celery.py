@@ -0,0 +1,19 @@
+"""
+Celery application for the bloodbank project.
+
+Workers are started with: celery -A bloodbank worker
+"""
+import os
+
+from celery import Celery
+
+# Set the default Django settings module for the 'celery' program.
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'bloodbank.settings')
+
+app = Celery('bloodbank')
+
+# Read CELERY_* settings from Django's settings module.
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+# Load tasks.py modules from all installed apps.
+app.autodiscover_tasks()
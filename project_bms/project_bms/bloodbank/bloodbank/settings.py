@@ -67,6 +67,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'main.context_processors.dashboard_url',
             ],
         },
     },
@@ -86,6 +87,8 @@ DATABASES = {
         'PASSWORD': '',
         'HOST': 'localhost',
         'PORT': '3306',
+        # Pin the session time zone to UTC so db_default=Now() stores UTC, matching USE_TZ
+        'OPTIONS': {'init_command': "SET time_zone = '+00:00'"},
     }
 }
 
@@ -116,6 +119,47 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Authentication backends
+# ProfileModelBackend loads request.user together with its Profile (role).
+
+AUTHENTICATION_BACKENDS = [
+    'main.backends.ProfileModelBackend',
+]
+
+
+# Cache
+# Shared by all workers so signal-based invalidation is seen everywhere.
+# ignore_exc turns an unreachable memcached into cache misses instead of errors.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+        'LOCATION': '127.0.0.1:11211',
+        'OPTIONS': {
+            'ignore_exc': True,
+        },
+    }
+}
+
+# Prefix for cache_page entries (e.g. the anonymous home page)
+CACHE_MIDDLEWARE_KEY_PREFIX = 'bloodbank'
+
+
+# Celery
+# Outgoing emails are sent by Celery workers (see main/tasks.py).
+
+CELERY_BROKER_URL = 'redis://localhost:6379/0'
+
+
+# Sessions
+# Session reads are served from the cache, falling back to the database on a miss.
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+# Flash messages live in a signed cookie only, so they never cause a session write
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
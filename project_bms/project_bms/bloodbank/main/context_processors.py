@@ -0,0 +1,13 @@
+from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
+
+
+def dashboard_url(request):
+    """
+    Exposes the user's role-specific dashboard URL (cached in the session at login) as
+    {{ dashboard_url }}, so dashboard links skip the generic 'dashboard' redirect.
+    Lazy, so pages that never render the link don't touch the session.
+    """
+    return {
+        'dashboard_url': SimpleLazyObject(lambda: request.session.get('dashboard_url') or reverse('dashboard')),
+    }
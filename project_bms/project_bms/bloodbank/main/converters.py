@@ -0,0 +1,12 @@
+class RoleConverter:
+    """
+    Matches only the known user roles, so URLs with an unknown role are
+    rejected during URL resolution instead of inside the view.
+    """
+    regex = 'admin|donor|requester'
+
+    def to_python(self, value):
+        return value
+
+    def to_url(self, value):
+        return value
@@ -1,7 +1,31 @@
+import re
+
 from django import forms
 from django.contrib.auth.models import User # Import Django's User model
+from django.core.validators import RegexValidator
 from .models import Donor, Requester # Ensure both Donor and Requester models are imported
 
+# Shared, precompiled validator for phone numbers: optional leading '+', then digits that may be
+# grouped with spaces, dashes or parentheses (e.g. '+8801712345678', '01712-345678', '(02) 9876543')
+PHONE_RE = re.compile(r'^\+?[\d(][\d ()-]{5,13}\d$')
+PHONE_VALIDATOR = RegexValidator(PHONE_RE, "Enter a valid phone number: digits, spaces, dashes or parentheses, optionally starting with '+'.")
+
+# Shared attrs for plain date inputs; widgets copy attrs on init, so this dict is never mutated
+DATE_PLACEHOLDER_ATTRS = {'placeholder': 'YYYY-MM-DD', 'class': 'form-control'}
+
+# Adds the 'form-control' class to every field of a form class, and the shared phone validator
+# to its 'phone' field if it has one.
+# This runs once at import time on base_fields; Django deep-copies base_fields (widgets included)
+# into each form instance, so the attrs propagate without any per-instance __init__ work.
+def _add_form_control(form_cls):
+    for field_name, field in form_cls.base_fields.items():
+        current_attrs = field.widget.attrs.get('class', '')
+        if 'form-control' not in current_attrs.split():
+            field.widget.attrs['class'] = (current_attrs + ' form-control').strip()
+        if field_name == 'phone' and PHONE_VALIDATOR not in field.validators:
+            field.validators.append(PHONE_VALIDATOR)
+    return form_cls
+
 # Custom DateInput widget for HTML5 date picker
 class DateInput(forms.DateInput):
     # Overriding the default input type to use the HTML5 date picker
@@ -9,24 +33,18 @@ class DateInput(forms.DateInput):
 
 # Form for User Registration
 class UserRegistrationForm(forms.ModelForm):
-    password = forms.CharField(widget=forms.PasswordInput)
+    password = forms.CharField(widget=forms.PasswordInput(attrs={
+        'class': 'form-control',
+        'placeholder': 'Enter your password',
+    }))
 
     class Meta:
         model = User
         fields = ['username', 'email', 'password']
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Add the 'form-control' class to all fields
-        for field_name, field in self.fields.items():
-            current_attrs = field.widget.attrs.get('class', '')
-            field.widget.attrs['class'] = (current_attrs + ' form-control').strip()
-            if field_name == 'email':
-                field.widget.attrs['placeholder'] = 'e.g., user@example.com'
-            elif field_name == 'username':
-                field.widget.attrs['placeholder'] = 'Choose a username'
-            elif field_name == 'password':
-                field.widget.attrs['placeholder'] = 'Enter your password'
+        widgets = {
+            'username': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Choose a username'}),
+            'email': forms.EmailInput(attrs={'class': 'form-control', 'placeholder': 'e.g., user@example.com'}),
+        }
 
 
 # Donor Registration Form
@@ -37,12 +55,7 @@ class DonorRegistrationForm(forms.ModelForm):
         # We exclude 'user' because it will be set by the view after the User object is created.
         exclude = ['user'] 
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Add the 'form-control' class to all fields
-        for field in self.fields.values():
-            current_attrs = field.widget.attrs.get('class', '')
-            field.widget.attrs['class'] = (current_attrs + ' form-control').strip()
+_add_form_control(DonorRegistrationForm)
 
 
 # Requester Registration Form
@@ -52,16 +65,12 @@ class RequesterRegistrationForm(forms.ModelForm):
         model = Requester
         # We exclude 'user' because it will be set by the view after the User object is created.
         exclude = ['user']
+        # For date fields, suggest a format
+        widgets = {
+            'date_needed': forms.DateInput(attrs=DATE_PLACEHOLDER_ATTRS),
+        }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Add the 'form-control' class to all fields
-        for field in self.fields.values():
-            current_attrs = field.widget.attrs.get('class', '')
-            field.widget.attrs['class'] = (current_attrs + ' form-control').strip()
-            # For date fields, you can suggest a format
-            if isinstance(field, forms.DateField):
-                field.widget.attrs['placeholder'] = 'YYYY-MM-DD'
+_add_form_control(RequesterRegistrationForm)
 
 
 # Donor Form (for editing/management of Donor profiles)
@@ -78,12 +87,7 @@ class DonorForm(forms.ModelForm):
             'address': forms.Textarea(attrs={'placeholder': 'Enter full address', 'rows': 4}),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Add the 'form-control' class to all fields, preserving existing attributes
-        for field in self.fields.values():
-            current_attrs = field.widget.attrs.get('class', '')
-            field.widget.attrs['class'] = (current_attrs + ' form-control').strip()
+_add_form_control(DonorForm)
 
 
 # Requester Form (for editing/management of Requester profiles or creating requests)
@@ -104,9 +108,4 @@ class RequesterForm(forms.ModelForm):
             'message': forms.Textarea(attrs={'placeholder': 'e.g., Patient needs blood for an urgent surgery.', 'rows': 4}),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Add the 'form-control' class to all fields, preserving existing attributes
-        for field in self.fields.values():
-            current_attrs = field.widget.attrs.get('class', '')
-            field.widget.attrs['class'] = (current_attrs + ' form-control').strip()
\ No newline at end of file
+_add_form_control(RequesterForm)
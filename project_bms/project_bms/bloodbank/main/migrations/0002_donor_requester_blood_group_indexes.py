@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donor',
+            index=models.Index(fields=['blood_group', 'age'], name='donor_bg_age_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='requester',
+            index=models.Index(fields=['blood_group', 'date_needed'], name='requester_bg_needed_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-15 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0002_donor_requester_blood_group_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['requester', '-timestamp'], name='notif_requester_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='donationrequest',
+            index=models.Index(fields=['donor', 'status', '-timestamp'], name='donreq_donor_status_ts_idx'),
+        ),
+    ]
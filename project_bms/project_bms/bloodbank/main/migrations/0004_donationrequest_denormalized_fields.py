@@ -0,0 +1,44 @@
+# Generated by Django 4.2 on 2026-10-15 10:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_denormalized_fields(apps, schema_editor):
+    DonationRequest = apps.get_model('main', 'DonationRequest')
+    for donation_request in DonationRequest.objects.select_related('donor', 'requester'):
+        donation_request.donor_name = donation_request.donor.name
+        donation_request.requester_name = donation_request.requester.name
+        donation_request.blood_group = donation_request.donor.blood_group
+        donation_request.save(update_fields=['donor_name', 'requester_name', 'blood_group'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0003_notification_donationrequest_dashboard_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='donationrequest',
+            name='donor_name',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='donationrequest',
+            name='requester_name',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='donationrequest',
+            name='blood_group',
+            field=models.CharField(blank=True, choices=[('A+', 'A+'), ('A-', 'A-'), ('B+', 'B+'), ('B-', 'B-'), ('O+', 'O+'), ('O-', 'O-'), ('AB+', 'AB+'), ('AB-', 'AB-')], max_length=3),
+        ),
+        migrations.AlterField(
+            model_name='donationrequest',
+            name='requester',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sent_requests', to='main.requester'),
+        ),
+        migrations.RunPython(populate_denormalized_fields, migrations.RunPython.noop),
+    ]
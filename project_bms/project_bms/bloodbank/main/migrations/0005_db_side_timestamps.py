@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-15 10:30
+
+from django.db import migrations, models
+import django.db.models.functions.datetime
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0004_donationrequest_denormalized_fields'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='donationrequest',
+            name='timestamp',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='timestamp',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='requester',
+            name='date_requested',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2 on 2026-10-15 11:00
+
+from django.db import migrations, models
+
+
+def copy_is_read_to_read_at(apps, schema_editor):
+    # Rows already marked read get their creation time as the best available read time
+    for model_name in ('Notification', 'DonationRequest'):
+        model = apps.get_model('main', model_name)
+        model.objects.filter(is_read=True).update(read_at=models.F('timestamp'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_db_side_timestamps'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='donationrequest',
+            name='read_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='read_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(copy_is_read_to_read_at, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='donationrequest',
+            name='is_read',
+        ),
+        migrations.RemoveField(
+            model_name='notification',
+            name='is_read',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-15 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_replace_is_read_with_read_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='requester',
+            index=models.Index(fields=['user', '-date_needed'], name='requester_user_needed_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-15 12:00
+
+from django.db import migrations
+from django.db.models.functions import Trim, Upper
+
+
+def uppercase_blood_groups(apps, schema_editor):
+    for model_name in ('Donor', 'Requester'):
+        model = apps.get_model('main', model_name)
+        model.objects.update(blood_group=Upper(Trim('blood_group')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0007_requester_user_date_needed_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(uppercase_blood_groups, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,15 @@
 from django.db import models
+from django.db.models.functions import Now
 from django.contrib.auth.models import User # Import Django's User model
 
+# Blood groups shared by Donor, Requester and DonationRequest
+BLOOD_GROUPS = (
+    ('A+', 'A+'), ('A-', 'A-'),
+    ('B+', 'B+'), ('B-', 'B-'),
+    ('O+', 'O+'), ('O-', 'O-'),
+    ('AB+', 'AB+'), ('AB-', 'AB-'),
+)
+
 # Create a Profile model to store user roles
 class Profile(models.Model):
     USER_ROLES = [
@@ -11,28 +20,49 @@ class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE) # Link to the User model
     role = models.CharField(max_length=10, choices=USER_ROLES)
 
+    @classmethod
+    def get_role_for(cls, user):
+        """
+        Returns the user's role, or None if the user has no profile.
+        Fetches only the role column instead of the whole profile row.
+        """
+        return cls.objects.filter(user=user).values_list('role', flat=True).first()
+
     def __str__(self):
         return f"{self.user.username} - {self.role}"
 
 
+# Managers exposing list querysets that load only the columns list pages render,
+# leaving out the large text fields (address, reason, message)
+class DonorManager(models.Manager):
+    def list_qs(self):
+        return self.only('id', 'name', 'blood_group', 'phone', 'age')
+
+
+class RequesterManager(models.Manager):
+    def list_qs(self):
+        return self.only('id', 'name', 'blood_group', 'phone', 'date_needed', 'location')
+
+
 # Donor model
 class Donor(models.Model):
     # Link a Donor record to a user account
     user = models.OneToOneField(User, on_delete=models.CASCADE, null=True, blank=True)
     
-    BLOOD_GROUPS = [
-        ('A+', 'A+'), ('A-', 'A-'),
-        ('B+', 'B+'), ('B-', 'B-'),
-        ('O+', 'O+'), ('O-', 'O-'),
-        ('AB+', 'AB+'), ('AB-', 'AB-')
-    ]
-    
     name = models.CharField(max_length=100)
     age = models.IntegerField()
     blood_group = models.CharField(max_length=3, choices=BLOOD_GROUPS)
     phone = models.CharField(max_length=15)
     address = models.TextField()
 
+    objects = DonorManager()
+
+    class Meta:
+        # The leading blood_group column also serves plain blood_group lookups (search, find-donors)
+        indexes = [
+            models.Index(fields=['blood_group', 'age'], name='donor_bg_age_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.blood_group})"
 
@@ -41,14 +71,23 @@ class Requester(models.Model):
     # Changed from OneToOneField to ForeignKey to allow a user to have multiple requests
     user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='requests')
     name = models.CharField(max_length=100)
-    blood_group = models.CharField(max_length=3, choices=Donor.BLOOD_GROUPS)
+    blood_group = models.CharField(max_length=3, choices=BLOOD_GROUPS)
     phone = models.CharField(max_length=15)
     reason = models.TextField()
-    date_requested = models.DateTimeField(auto_now_add=True)
+    date_requested = models.DateTimeField(db_default=Now(), editable=False) # Set by the database on insert; call refresh_from_db() to read it on a fresh instance
     date_needed = models.DateField(null=True, blank=True)
     location = models.CharField(max_length=200, null=True, blank=True)
     message = models.TextField(blank=True)
 
+    objects = RequesterManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['blood_group', 'date_needed'], name='requester_bg_needed_idx'),
+            # Matches the requester dashboard: a user's requests, latest needed date first
+            models.Index(fields=['user', '-date_needed'], name='requester_user_needed_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name} requested {self.blood_group}"
 
@@ -57,8 +96,14 @@ class Notification(models.Model):
     requester = models.ForeignKey(Requester, on_delete=models.CASCADE, related_name='notifications')
     donor = models.ForeignKey(Donor, on_delete=models.CASCADE)
     message = models.TextField()
-    is_read = models.BooleanField(default=False)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    read_at = models.DateTimeField(null=True, blank=True, db_index=True) # NULL while unread
+    timestamp = models.DateTimeField(db_default=Now(), editable=False) # Set by the database on insert; call refresh_from_db() to read it on a fresh instance
+
+    class Meta:
+        # Matches the requester dashboard: filter by requester, newest first
+        indexes = [
+            models.Index(fields=['requester', '-timestamp'], name='notif_requester_ts_idx'),
+        ]
 
     def __str__(self):
         return f"Notification for {self.requester.name} about {self.donor.name}"
@@ -71,12 +116,23 @@ class DonationRequest(models.Model):
         ('rejected', 'Rejected'),
     ]
     donor = models.ForeignKey(Donor, on_delete=models.CASCADE, related_name='donation_requests')
-    requester = models.ForeignKey(Requester, on_delete=models.CASCADE)
+    requester = models.ForeignKey(Requester, on_delete=models.CASCADE, related_name='sent_requests')
+    # Denormalized copies of frequently-read fields, set when the request is created and kept
+    # in sync by signals.py, so listing donation requests doesn't need to join Donor/Requester
+    donor_name = models.CharField(max_length=100, blank=True)
+    requester_name = models.CharField(max_length=100, blank=True)
+    blood_group = models.CharField(max_length=3, choices=BLOOD_GROUPS, blank=True)
     message = models.TextField(blank=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending') # Added from Code2
-    is_read = models.BooleanField(default=False)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    read_at = models.DateTimeField(null=True, blank=True, db_index=True) # NULL while unread
+    timestamp = models.DateTimeField(db_default=Now(), editable=False) # Set by the database on insert; call refresh_from_db() to read it on a fresh instance
+
+    class Meta:
+        # Matches the donor dashboard: pending requests for a donor, newest first
+        indexes = [
+            models.Index(fields=['donor', 'status', '-timestamp'], name='donreq_donor_status_ts_idx'),
+        ]
 
     def __str__(self):
         # Updated __str__ to include status from Code2
-        return f"Request to {self.donor.name} for {self.requester.name} ({self.status})"
\ No newline at end of file
+        return f"Request to {self.donor_name} for {self.requester_name} ({self.status})"
\ No newline at end of file
@@ -0,0 +1,71 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import BLOOD_GROUPS, DonationRequest, Donor, Requester
+
+# Cache key for the admin dashboard's aggregates (blood group counts and totals)
+ADMIN_DASHBOARD_CACHE_KEY = 'admin_dash_ctx'
+
+# Cache key template for the list of donors with a given blood group (find-donors page)
+DONORS_BY_BLOOD_GROUP_CACHE_KEY = 'donors_bg:{}'
+
+
+@receiver(pre_save, sender=Donor)
+@receiver(pre_save, sender=Requester)
+def normalize_blood_group(sender, instance, **kwargs):
+    """
+    Stores blood groups in canonical uppercase so lookups can use plain equality on the index.
+    """
+    if instance.blood_group:
+        instance.blood_group = instance.blood_group.upper().strip()
+
+
+@receiver(post_save, sender=Donor)
+def sync_donation_request_donor_fields(sender, instance, created, **kwargs):
+    """
+    Keeps the donor name and blood group copied onto DonationRequest in sync when a donor is edited.
+    Only rows whose copies actually differ are updated.
+    """
+    if created:
+        return
+    DonationRequest.objects.filter(donor=instance).exclude(
+        donor_name=instance.name, blood_group=instance.blood_group,
+    ).update(donor_name=instance.name, blood_group=instance.blood_group)
+
+
+@receiver(post_save, sender=Requester)
+def sync_donation_request_requester_fields(sender, instance, created, **kwargs):
+    """
+    Keeps the requester name copied onto DonationRequest in sync when a requester is edited.
+    """
+    if created:
+        return
+    DonationRequest.objects.filter(requester=instance).exclude(
+        requester_name=instance.name,
+    ).update(requester_name=instance.name)
+
+
+@receiver(post_save, sender=Donor)
+@receiver(post_delete, sender=Donor)
+@receiver(post_save, sender=Requester)
+@receiver(post_delete, sender=Requester)
+def invalidate_admin_dashboard_cache(sender, **kwargs):
+    """
+    Drops the cached admin dashboard aggregates whenever a donor or requester changes.
+    Deferred until commit, so a concurrent request can't re-cache the pre-commit counts.
+    """
+    transaction.on_commit(lambda: cache.delete(ADMIN_DASHBOARD_CACHE_KEY))
+
+
+@receiver(post_save, sender=Donor)
+@receiver(post_delete, sender=Donor)
+def invalidate_donors_by_blood_group_cache(sender, **kwargs):
+    """
+    Drops the cached donor lists for every blood group whenever a donor changes
+    (a donor whose blood group was edited must leave the old group's list too).
+    Deferred until commit, like invalidate_admin_dashboard_cache.
+    """
+    keys = [DONORS_BY_BLOOD_GROUP_CACHE_KEY.format(group) for group, _ in BLOOD_GROUPS]
+    transaction.on_commit(lambda: cache.delete_many(keys))
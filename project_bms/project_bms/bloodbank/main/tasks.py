@@ -0,0 +1,10 @@
+from celery import shared_task
+from django.core.mail import send_mail
+
+
+@shared_task
+def send_email_task(subject, body, from_email, recipients):
+    """
+    Sends an email outside the request/response cycle.
+    """
+    send_mail(subject, body, from_email, recipients, fail_silently=False)
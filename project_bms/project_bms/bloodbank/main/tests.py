@@ -1,3 +1,134 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
 
-# Create your tests here.
+from .models import DonationRequest, Donor, Profile, Requester
+
+# Tests must not depend on a running memcached server
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class RoleSessionTests(TestCase):
+    """
+    Login/register pick the role dashboard; dashboards are guarded by the profile's current role.
+    """
+    password = 'S3cure-pass!'
+
+    def create_donor_user(self, username='donor1'):
+        user = User.objects.create_user(username=username, password=self.password)
+        Profile.objects.create(user=user, role='donor')
+        Donor.objects.create(user=user, name='Donor One', age=30, blood_group='O+', phone='01712-345678', address='Dhaka')
+        return user
+
+    def test_login_redirects_to_role_dashboard(self):
+        self.create_donor_user()
+        response = self.client.post(reverse('login', args=['donor']), {'username': 'donor1', 'password': self.password})
+        self.assertRedirects(response, reverse('donor_dashboard'), fetch_redirect_response=False)
+        self.assertEqual(self.client.session['dashboard_url'], reverse('donor_dashboard'))
+        self.assertNotIn('role', self.client.session)
+
+    def test_login_with_wrong_role_is_rejected(self):
+        self.create_donor_user()
+        response = self.client.post(reverse('login', args=['requester']), {'username': 'donor1', 'password': self.password})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('_auth_user_id', self.client.session)
+        self.assertNotIn('dashboard_url', self.client.session)
+
+    def test_register_creates_profile_and_redirects_to_role_dashboard(self):
+        response = self.client.post(reverse('register', args=['requester']), {
+            'username': 'requester1',
+            'email': 'requester1@example.com',
+            'password': self.password,
+            'name': 'Requester One',
+            'blood_group': 'A+',
+            'phone': '+8801712345678',
+            'reason': 'Surgery',
+        })
+        self.assertRedirects(response, reverse('requester_dashboard'), fetch_redirect_response=False)
+        self.assertEqual(self.client.session['dashboard_url'], reverse('requester_dashboard'))
+        user = User.objects.get(username='requester1')
+        self.assertEqual(user.profile.role, 'requester')
+        self.assertTrue(user.requests.exists())
+
+    def test_donor_is_redirected_away_from_admin_dashboard(self):
+        self.client.force_login(self.create_donor_user())
+        response = self.client.get(reverse('admin_dashboard'))
+        self.assertRedirects(response, reverse('home'), fetch_redirect_response=False)
+
+    def test_role_change_in_admin_takes_effect_immediately(self):
+        user = self.create_donor_user()
+        self.client.post(reverse('login', args=['donor']), {'username': 'donor1', 'password': self.password})
+        self.assertEqual(self.client.get(reverse('donor_dashboard')).status_code, 200)
+
+        # Demote the logged-in donor mid-session, as an admin would on the Profile admin page
+        Profile.objects.filter(user=user).update(role='requester')
+        response = self.client.get(reverse('donor_dashboard'))
+        self.assertRedirects(response, reverse('home'), fetch_redirect_response=False)
+        response = self.client.get(reverse('dashboard'))
+        self.assertRedirects(response, reverse('requester_dashboard'), fetch_redirect_response=False)
+        self.assertEqual(self.client.session['dashboard_url'], reverse('requester_dashboard'))
+
+    def test_deleted_profile_logs_user_out(self):
+        user = self.create_donor_user()
+        self.client.force_login(user)
+        Profile.objects.filter(user=user).delete()
+        response = self.client.get(reverse('dashboard'))
+        self.assertRedirects(response, reverse('home'), fetch_redirect_response=False)
+        self.assertNotIn('_auth_user_id', self.client.session)
+
+    def test_dashboard_logs_out_user_without_profile(self):
+        user = User.objects.create_user(username='noprofile', password=self.password)
+        self.client.force_login(user)
+        response = self.client.get(reverse('dashboard'))
+        self.assertRedirects(response, reverse('home'), fetch_redirect_response=False)
+        self.assertNotIn('_auth_user_id', self.client.session)
+
+
+class DonationRequestSyncTests(TestCase):
+    """
+    The names and blood group copied onto DonationRequest follow edits to the donor/requester.
+    """
+    def setUp(self):
+        self.donor = Donor.objects.create(name='Donor One', age=30, blood_group='O+', phone='01712345678', address='Dhaka')
+        self.requester = Requester.objects.create(name='Requester One', blood_group='O+', phone='01812345678', reason='Surgery')
+        self.donation_request = DonationRequest.objects.create(
+            donor=self.donor, requester=self.requester,
+            donor_name=self.donor.name, requester_name=self.requester.name, blood_group=self.donor.blood_group,
+        )
+
+    def test_editing_donor_updates_copies(self):
+        self.donor.name = 'Donor Renamed'
+        self.donor.blood_group = 'b-'
+        self.donor.save()
+        self.donation_request.refresh_from_db()
+        self.assertEqual(self.donation_request.donor_name, 'Donor Renamed')
+        self.assertEqual(self.donation_request.blood_group, 'B-')
+
+    def test_editing_requester_updates_copies(self):
+        self.requester.name = 'Requester Renamed'
+        self.requester.save()
+        self.donation_request.refresh_from_db()
+        self.assertEqual(self.donation_request.requester_name, 'Requester Renamed')
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AdminDashboardPaginationTests(TestCase):
+    """
+    Page links stay bounded as the tables grow, and paging one list keeps the other's page.
+    """
+    def setUp(self):
+        admin = User.objects.create_user(username='admin1', password='S3cure-pass!')
+        Profile.objects.create(user=admin, role='admin')
+        Donor.objects.bulk_create(
+            Donor(name=f'Donor {i}', age=30, blood_group='O+', phone='01712345678', address='Dhaka') for i in range(1000)
+        )
+        self.client.force_login(admin)
+
+    def test_page_links_are_elided_and_keep_other_list_page(self):
+        response = self.client.get(reverse('admin_dashboard'), {'donor_page': 10, 'request_page': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '?donor_page=11&request_page=1"')
+        self.assertNotContains(response, '?donor_page=5&')  # Far from page 10, so elided
+        self.assertContains(response, '?donor_page=20&request_page=1"')  # Last page is always linked
+        self.assertContains(response, '<span class="page-link">\u2026</span>')
@@ -1,9 +1,15 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.core.mail import send_mail
+from django.urls import reverse
+from django.template.loader import render_to_string
 from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils import timezone
+from django.db import transaction
 from django.db.models import Count
-from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.cache import cache_page
 from django.contrib.auth.forms import AuthenticationForm # Django's login form
 from django.contrib import messages # Import messages for user feedback
 
@@ -16,6 +22,31 @@ from .forms import (
     RequesterForm
 )
 from .models import Profile, Donor, Requester, User, Notification, DonationRequest # Ensure DonationRequest is imported
+from .signals import ADMIN_DASHBOARD_CACHE_KEY, DONORS_BY_BLOOD_GROUP_CACHE_KEY
+from .tasks import send_email_task
+
+# --- Role Helpers ---
+
+def get_role(user):
+    """
+    Returns the user's role, or None if the user has no profile.
+    Uses the profile ProfileModelBackend already joined onto request.user when it's there,
+    otherwise fetches just the role column with Profile.get_role_for.
+    """
+    if not user.is_authenticated:
+        return None
+    if User.profile.is_cached(user): # select_related caches None when the user has no profile
+        profile = User.profile.related.get_cached_value(user)
+        return profile.role if profile is not None else None
+    return Profile.get_role_for(user)
+
+def current_role(request):
+    """
+    Returns the logged-in user's current role.
+    Read from the profile on every request (no extra query: ProfileModelBackend joins it onto
+    request.user), so a role changed or removed in the admin takes effect immediately.
+    """
+    return get_role(request.user)
 
 # --- Decorators for Role-Based Access ---
 
@@ -25,7 +56,7 @@ def admin_required(view_func):
     """
     @login_required(login_url='login') # Use generic login URL, role specified in URL pattern
     def _wrapped_view(request, *args, **kwargs):
-        if not hasattr(request.user, 'profile') or request.user.profile.role != 'admin':
+        if current_role(request) != 'admin':
             messages.error(request, "You do not have permission to access this page.")
             return redirect('home') # Redirect unauthorized users to home or a 403 page
         return view_func(request, *args, **kwargs)
@@ -37,7 +68,7 @@ def donor_required(view_func):
     """
     @login_required(login_url='login') # Use generic login URL, role specified in URL pattern
     def _wrapped_view(request, *args, **kwargs):
-        if not hasattr(request.user, 'profile') or request.user.profile.role != 'donor':
+        if current_role(request) != 'donor':
             messages.error(request, "You do not have permission to access this page.")
             return redirect('home')
         return view_func(request, *args, **kwargs)
@@ -49,7 +80,7 @@ def requester_required(view_func):
     """
     @login_required(login_url='login') # Use generic login URL, role specified in URL pattern
     def _wrapped_view(request, *args, **kwargs):
-        if not hasattr(request.user, 'profile') or request.user.profile.role != 'requester':
+        if current_role(request) != 'requester':
             messages.error(request, "You do not have permission to access this page.")
             return redirect('home')
         return view_func(request, *args, **kwargs)
@@ -58,11 +89,19 @@ def requester_required(view_func):
 
 # --- General Views ---
 
+@cache_page(60 * 15)
+def _cached_home_view(request):
+    return render(request, 'main/home.html')
+
 def home_view(request):
     """
     Displays the main landing page with role choices.
+    The page is identical for every anonymous visitor without pending messages,
+    so those requests are served from the cache.
     """
-    return render(request, 'main/home.html')
+    if request.user.is_authenticated or messages.get_messages(request):
+        return render(request, 'main/home.html')
+    return _cached_home_view(request)
 
 # --- Authentication Views ---
 
@@ -84,19 +123,22 @@ def register_view(request, role):
             return redirect('home')
 
         if user_form.is_valid() and profile_form and profile_form.is_valid():
-            user = user_form.save(commit=False)
-            user.set_password(user_form.cleaned_data['password'])
-            user.save()
+            # User, role profile and donor/requester record are committed together
+            with transaction.atomic():
+                user = user_form.save(commit=False)
+                user.set_password(user_form.cleaned_data['password'])
+                user.save()
 
-            Profile.objects.create(user=user, role=role) # Create the user's role profile
+                Profile.objects.create(user=user, role=role) # Create the user's role profile
 
-            profile = profile_form.save(commit=False)
-            profile.user = user # Link the donor/requester profile to the new user account
-            profile.save()
+                profile = profile_form.save(commit=False)
+                profile.user = user # Link the donor/requester profile to the new user account
+                profile.save()
 
             login(request, user)
+            request.session['dashboard_url'] = reverse(DASHBOARD_URL_NAMES[role])
             messages.success(request, f"Registration successful! Welcome, {user.username}.")
-            return redirect('dashboard') # Redirect to the new unified dashboard
+            return redirect_to_dashboard(request) # Redirect to the new user's dashboard
         else:
             messages.error(request, "Please correct the errors below.")
             # If forms are invalid, they will be rendered with errors
@@ -127,25 +169,23 @@ def login_view(request, role):
         # If already logged in, redirect to dashboard.
         # Consider checking if the role matches, otherwise, allow logging out first.
         messages.info(request, "You are already logged in.")
-        return redirect('dashboard') 
+        return redirect_to_dashboard(request) 
 
     if request.method == 'POST':
         form = AuthenticationForm(request, data=request.POST)
         if form.is_valid():
-            username = form.cleaned_data.get('username')
-            password = form.cleaned_data.get('password')
-            user = authenticate(username=username, password=password)
+            # The form already authenticated the user while validating; reuse that result
+            # instead of running the password hasher a second time
+            user = form.get_user()
             
-            if user is not None:
-                # Check if the user has a profile and if the role matches
-                if hasattr(user, 'profile') and user.profile.role == role:
-                    login(request, user)
-                    messages.success(request, f"Logged in as {user.username} ({role.capitalize()}).")
-                    return redirect('dashboard')
-                else:
-                    messages.error(request, f"Invalid credentials or incorrect role for {role.capitalize()}.")
+            # Check if the user has a profile and if the role matches
+            if get_role(user) == role:
+                login(request, user)
+                request.session['dashboard_url'] = reverse(DASHBOARD_URL_NAMES[role])
+                messages.success(request, f"Logged in as {user.username} ({role.capitalize()}).")
+                return redirect_to_dashboard(request)
             else:
-                messages.error(request, "Invalid username or password.")
+                messages.error(request, f"Invalid credentials or incorrect role for {role.capitalize()}.")
         else:
             messages.error(request, "Invalid username or password. Please check your credentials.")
     else: # GET request
@@ -164,65 +204,118 @@ def logout_view(request):
 
 # --- Dashboard and Overview ---
 
+# URL names of the role-specific dashboards
+DASHBOARD_URL_NAMES = {
+    'admin': 'admin_dashboard',
+    'donor': 'donor_dashboard',
+    'requester': 'requester_dashboard',
+}
+
+def redirect_to_dashboard(request):
+    """
+    Redirects straight to the user's role-specific dashboard, using the URL
+    cached in the session at login (falls back to the generic 'dashboard' URL).
+    """
+    return redirect(request.session.get('dashboard_url') or 'dashboard')
+
 @login_required # This decorator ensures only logged-in users can access it
 def dashboard(request):
     """
-    Displays the dashboard based on the user's role.
+    Sends the user to the dashboard for their role.
     """
-    role = request.user.profile.role if hasattr(request.user, 'profile') else 'unknown'
+    role = current_role(request)
 
-    if role == 'admin':
-        # Your existing dashboard logic for admin
-        donors = Donor.objects.all()
-        requesters = Requester.objects.all()
-        
-        total_donors = donors.count()
-        total_requests = requesters.count()
-        
-        # Count donors by blood group
-        blood_group_counts = Donor.objects.values('blood_group').annotate(count=Count('blood_group')).order_by('-count')
-
-        context = {
-            'donors': donors,
-            'requesters': requesters,
-            'total_donors': total_donors,
-            'total_requests': total_requests,
-            'blood_group_counts': blood_group_counts,
-            'user_role': role
-        }
-        return render(request, 'main/admin_dashboard.html', context) # Adjusted template name for clarity
-        
-    elif role == 'donor':
-        donor_profile = get_object_or_404(Donor, user=request.user)
-
-        # Fetch all donation requests for this donor, newest first
-        # Assuming related_name='donation_requests' on DonationRequest model's donor field
-        donation_requests = donor_profile.donation_requests.filter(status='pending').order_by('-timestamp')
-        
-        context = {
-            'donor': donor_profile,
-            'requests': donation_requests,
-            'user_role': role
-        }
-        return render(request, 'main/donor_dashboard.html', context) # Adjusted template name
-        
-    elif role == 'requester':
-        # Now we fetch a LIST of requests, not just one profile
-        user_requests = Requester.objects.filter(user=request.user).order_by('-date_needed')
-        # Fetch notifications for all requests made by this user
-        notifications = Notification.objects.filter(requester__in=user_requests).order_by('-timestamp')
-        
-        context = {
-            'requests': user_requests, # Changed from 'requester' to 'requests'
-            'notifications': notifications,
-            'user_role': role
-        }
-        return render(request, 'main/requester_dashboard.html', context) # Adjusted template name
+    if role in DASHBOARD_URL_NAMES:
+        dashboard_url = reverse(DASHBOARD_URL_NAMES[role])
+        if request.session.get('dashboard_url') != dashboard_url: # Avoid a session write on every visit
+            request.session['dashboard_url'] = dashboard_url
+        return redirect(dashboard_url)
     else:
         messages.warning(request, "Your account does not have an assigned role. Please contact support.")
         logout(request) # Log out users with no valid role to prevent issues
         return redirect('home')
 
+@admin_required
+def admin_dashboard(request):
+    """
+    Displays the admin dashboard: donor/request totals, blood group distribution and paginated lists.
+    """
+    # Aggregates are cached until a Donor/Requester is saved or deleted (see signals.py)
+    aggregates = cache.get(ADMIN_DASHBOARD_CACHE_KEY)
+    if aggregates is None:
+        # Count donors by blood group; the per-group counts also add up to the donor total,
+        # so no separate COUNT query is needed for donors
+        blood_group_counts = list(Donor.objects.values('blood_group').annotate(count=Count('blood_group')).order_by('-count'))
+        aggregates = {
+            'blood_group_counts': blood_group_counts,
+            'total_donors': sum(item['count'] for item in blood_group_counts),
+            'total_requests': Requester.objects.count(),
+        }
+        cache.set(ADMIN_DASHBOARD_CACHE_KEY, aggregates, 300)
+    blood_group_counts = aggregates['blood_group_counts']
+    total_donors = aggregates['total_donors']
+    total_requests = aggregates['total_requests']
+
+    # Only the visible page of donors/requesters is loaded;
+    # the totals are reused instead of letting the paginators count again
+    donor_paginator = Paginator(Donor.objects.list_qs().order_by('id'), 50)
+    donor_paginator.count = total_donors
+    donors = donor_paginator.get_page(request.GET.get('donor_page'))
+    requester_paginator = Paginator(Requester.objects.list_qs().order_by('id'), 50)
+    requester_paginator.count = total_requests
+    requesters = requester_paginator.get_page(request.GET.get('request_page'))
+
+    context = {
+        'donors': donors,
+        'requesters': requesters,
+        # A few page links around the current page instead of one per page
+        'donor_page_range': donor_paginator.get_elided_page_range(donors.number),
+        'request_page_range': requester_paginator.get_elided_page_range(requesters.number),
+        'total_donors': total_donors,
+        'total_requests': total_requests,
+        'blood_group_counts': blood_group_counts,
+        'user_role': 'admin'
+    }
+    return render(request, 'main/admin_dashboard.html', context)
+
+@donor_required
+def donor_dashboard(request):
+    """
+    Displays the donor's profile and their pending donation requests.
+    """
+    donor_profile = get_object_or_404(Donor, user=request.user)
+
+    # Fetch all pending donation requests for this donor, newest first
+    donation_requests = donor_profile.donation_requests.select_related('requester').filter(status='pending').order_by('-timestamp')
+    
+    context = {
+        'donor': donor_profile,
+        'requests': donation_requests,
+        'user_role': 'donor'
+    }
+    return render(request, 'main/donor_dashboard.html', context)
+
+@requester_required
+def requester_dashboard(request):
+    """
+    Displays the requester's blood requests and the notifications about them.
+    """
+    # Now we fetch a LIST of requests, not just one profile
+    user_requests = Requester.objects.filter(user=request.user).order_by('-date_needed', '-id')
+    # Fetch the latest notifications for all requests made by this user (a single join, no IN-subquery)
+    notifications = Notification.objects.select_related('donor').filter(requester__user=request.user).order_by('-timestamp')[:100]
+    # Only one page of the user's requests is rendered
+    requests_paginator = Paginator(user_requests, 25)
+    requests_page = requests_paginator.get_page(request.GET.get('page'))
+    
+    context = {
+        'requests': requests_page, # Changed from 'requester' to 'requests'
+        'page_range': requests_paginator.get_elided_page_range(requests_page.number),
+        'notifications': notifications,
+        'user_role': 'requester'
+    }
+    return render(request, 'main/requester_dashboard.html', context)
+
 # --- Donor Management Views (Admin-only for add/delete) ---
 
 @admin_required
@@ -237,7 +330,7 @@ def add_donor(request):
     if request.method == 'POST' and form.is_valid():
         form.save() # Save the new donor to the database
         messages.success(request, "Donor added successfully.")
-        return redirect('dashboard') # Redirect to dashboard after successful addition
+        return redirect_to_dashboard(request) # Redirect to dashboard after successful addition
     return render(request, 'main/add_donor.html', {'form': form})
 
 @login_required # Now allows self-editing or admin editing
@@ -249,16 +342,16 @@ def edit_donor(request, pk):
     donor = get_object_or_404(Donor, pk=pk)
 
     # SECURITY CHECK: Allow access if the user is an admin OR if the user owns this profile.
-    if not (request.user.profile.role == 'admin' or request.user == donor.user):
+    if not (current_role(request) == 'admin' or request.user == donor.user):
         messages.error(request, "You do not have permission to access this page.")
-        return redirect('dashboard') # or redirect('home')
+        return redirect_to_dashboard(request) # or redirect('home')
 
     if request.method == 'POST':
         form = DonorForm(request.POST, instance=donor)
         if form.is_valid():
             form.save()
             messages.success(request, "Donor updated successfully.")
-            return redirect('dashboard') # Redirect to their dashboard after a successful edit
+            return redirect_to_dashboard(request) # Redirect to their dashboard after a successful edit
     else:
         form = DonorForm(instance=donor)
 
@@ -273,7 +366,8 @@ def delete_donor(request, pk):
     Handles deleting a donor.
     Requires admin authentication. Shows a confirmation page on GET, deletes on POST.
     """
-    donor = get_object_or_404(Donor, pk=pk) # Get donor object or raise 404
+    # Only the fields shown on the confirmation page are loaded
+    donor = get_object_or_404(Donor.objects.only('id', 'name', 'blood_group'), pk=pk) # Get donor object or raise 404
     
     if request.method == 'POST':
         # If the donor is linked to a user, consider deleting the user as well,
@@ -281,7 +375,7 @@ def delete_donor(request, pk):
         # For simplicity, if linked, Cascade delete in models will handle User profile.
         donor.delete() # Delete the donor from the database
         messages.success(request, "Donor deleted successfully.")
-        return redirect('dashboard') # Redirect back to the dashboard
+        return redirect_to_dashboard(request) # Redirect back to the dashboard
     
     # On GET request, show a confirmation page before deleting
     return render(request, 'main/delete_donor_confirm.html', {'donor': donor})
@@ -300,7 +394,7 @@ def add_requester(request):
     if request.method == 'POST' and form.is_valid():
         form.save() # Save the new request to the database
         messages.success(request, "Requester added successfully.")
-        return redirect('dashboard') # Redirect to dashboard after successful addition
+        return redirect_to_dashboard(request) # Redirect to dashboard after successful addition
     return render(request, 'main/add_requester.html', {'form': form})
 
 @login_required
@@ -308,9 +402,9 @@ def create_request_view(request):
     """
     Allows a logged-in requester to create a new blood request.
     """
-    if request.user.profile.role != 'requester':
+    if current_role(request) != 'requester':
         messages.error(request, "You must be a requester to create a blood request.")
-        return redirect('dashboard') # Redirect if user is not a requester
+        return redirect_to_dashboard(request) # Redirect if user is not a requester
 
     if request.method == 'POST':
         form = RequesterForm(request.POST)
@@ -320,7 +414,7 @@ def create_request_view(request):
             new_request.user = request.user
             new_request.save()
             messages.success(request, "Your blood request has been created successfully.")
-            return redirect('dashboard')
+            return redirect_to_dashboard(request)
         else:
             messages.error(request, "Please correct the errors below.")
     else:
@@ -337,16 +431,16 @@ def edit_requester(request, pk):
     requester = get_object_or_404(Requester, pk=pk)
 
     # SECURITY CHECK: Allow access if the user is an admin OR if the user owns this profile.
-    if not (request.user.profile.role == 'admin' or request.user == requester.user):
+    if not (current_role(request) == 'admin' or request.user == requester.user):
         messages.error(request, "You do not have permission to access this page.")
-        return redirect('dashboard') # or redirect('home')
+        return redirect_to_dashboard(request) # or redirect('home')
 
     if request.method == 'POST':
         form = RequesterForm(request.POST, instance=requester)
         if form.is_valid():
             form.save()
             messages.success(request, "Requester updated successfully.")
-            return redirect('dashboard') # Redirect to their dashboard after a successful edit
+            return redirect_to_dashboard(request) # Redirect to their dashboard after a successful edit
     else:
         form = RequesterForm(instance=requester)
         
@@ -361,17 +455,18 @@ def delete_requester(request, pk):
     Handles deleting a blood request.
     Allows access for Admins or the Requester who owns the request.
     """
-    requester_request = get_object_or_404(Requester, pk=pk)
+    # Only the fields needed for the ownership check and confirmation page are loaded
+    requester_request = get_object_or_404(Requester.objects.only('id', 'name', 'blood_group', 'user'), pk=pk)
     
     # SECURITY CHECK: Allow access only if user is an admin or the owner
-    if not (request.user.profile.role == 'admin' or request.user == requester_request.user):
+    if not (current_role(request) == 'admin' or request.user.pk == requester_request.user_id):
         messages.error(request, "You do not have permission to delete this request.")
-        return redirect('dashboard') # or redirect('home')
+        return redirect_to_dashboard(request) # or redirect('home')
 
     if request.method == 'POST':
         requester_request.delete()
         messages.success(request, "Blood request deleted successfully.")
-        return redirect('dashboard')
+        return redirect_to_dashboard(request)
         
     return render(request, 'main/delete_requester_confirm.html', {'request': requester_request})
 
@@ -384,10 +479,9 @@ def search_blood(request):
     Filters donors based on a query parameter.
     """
     query = request.GET.get('q') # Get the search query from URL parameters
-    donors = [] # Initialize donors list
-    if query:
-        # Filter donors where blood_group is exactly the query (case-insensitive)
-        donors = Donor.objects.filter(blood_group__iexact=query) 
+    # Blood groups are stored in uppercase (see signals.normalize_blood_group), so normalizing
+    # the query keeps this a plain equality lookup that can use the blood_group index
+    donors = Donor.objects.filter(blood_group=query.strip().upper()) if query else Donor.objects.none()
     return render(request, 'main/search.html', {'donors': donors, 'query': query})
 
 @admin_required
@@ -397,8 +491,13 @@ def find_donors_for_requester(request, requester_id):
     """
     requester = get_object_or_404(Requester, pk=requester_id)
     
-    # Find donors with the same blood group
-    matching_donors = Donor.objects.filter(blood_group=requester.blood_group)
+    # Find donors with the same blood group; the list is cached per blood group
+    # until a donor is saved or deleted (see signals.py)
+    cache_key = DONORS_BY_BLOOD_GROUP_CACHE_KEY.format(requester.blood_group)
+    matching_donors = cache.get(cache_key)
+    if matching_donors is None:
+        matching_donors = list(Donor.objects.list_qs().filter(blood_group=requester.blood_group))
+        cache.set(cache_key, matching_donors, 120)
     
     return render(request, 'main/find_donors.html', {
         'requester': requester,
@@ -411,26 +510,20 @@ def send_request_to_donor(request, donor_id, requester_id):
     Sends a blood donation request to a specific donor via email
     AND creates an on-site request (DonationRequest object).
     """
-    donor = get_object_or_404(Donor, pk=donor_id)
+    donor = get_object_or_404(Donor.objects.select_related('user'), pk=donor_id) # donor.user.email is used below
     requester = get_object_or_404(Requester, pk=requester_id)
 
     # Pre-populate the message for the admin
-    message_body = (
-        f"Dear {donor.name},\n\n"
-        f"There is an urgent need for your blood type ({donor.blood_group}) for a patient named {requester.name}. "
-        f"Please consider donating blood to save a life.\n\n"
-        f"Requester's Location: {requester.location}\n"
-        f"Date Needed: {requester.date_needed}\n\n"
-        f"Thank you for your consideration.\n\n"
-        f"Best regards,\n"
-        f"Blood Bank Administration"
-    )
+    message_body = render_to_string('main/emails/donation_request.txt', {'donor': donor, 'requester': requester})
     
     if request.method == 'POST':
         # Create the on-site donation request
         DonationRequest.objects.create(
             donor=donor,
             requester=requester,
+            donor_name=donor.name,
+            requester_name=requester.name,
+            blood_group=donor.blood_group,
             message=request.POST.get('message', message_body) # Use posted message if available, else default
         )
         messages.success(request, "On-site donation request created successfully.")
@@ -440,20 +533,20 @@ def send_request_to_donor(request, donor_id, requester_id):
         
         if recipient_email:
             try:
-                send_mail(
+                # Queue the email so the SMTP round-trip doesn't block this request
+                send_email_task.delay(
                     f"Urgent Blood Donation Request for {requester.name}", # Subject
                     request.POST.get('message', message_body), # Use posted message if available, else default
                     settings.DEFAULT_FROM_EMAIL,
                     [recipient_email],  # Send to the donor's email address
-                    fail_silently=False,
                 )
             except Exception as e:
-                messages.error(request, f"Failed to send email request: {e}")
+                messages.error(request, f"Failed to queue email request: {e}")
                 print(f"Error sending email to donor: {e}") # For debugging
         else:
             messages.warning(request, "Donor does not have a valid email address linked to their account. Email notification not sent.")
             
-        return redirect('dashboard')
+        return redirect_to_dashboard(request)
 
     return render(request, 'main/send_request_to_donor.html', {
         'donor': donor,
@@ -467,20 +560,11 @@ def send_donor_details_to_requester(request, requester_id, donor_id):
     Sends donor's contact details to the requester via email AND
     creates an on-site notification.
     """
-    requester = get_object_or_404(Requester, pk=requester_id)
+    requester = get_object_or_404(Requester.objects.select_related('user'), pk=requester_id) # requester.user.email is used below
     donor = get_object_or_404(Donor, pk=donor_id)
 
     # Pre-populate the message for the admin
-    message_body = (
-        f"Dear {requester.name},\n\n"
-        f"We have found a potential blood donor for you. Here are their details:\n\n"
-        f"Donor's Name: {donor.name}\n"
-        f"Blood Group: {donor.blood_group}\n"
-        f"Phone Number: {donor.phone}\n\n" # Assuming phone number is directly on Donor model
-        f"Please contact them to coordinate the donation. We wish you the best.\n\n"
-        f"Best regards,\n"
-        f"Blood Bank Administration"
-    )
+    message_body = render_to_string('main/emails/donor_details.txt', {'donor': donor, 'requester': requester})
 
     if request.method == 'POST':
         # Create the on-site notification
@@ -497,21 +581,21 @@ def send_donor_details_to_requester(request, requester_id, donor_id):
         
         if recipient_email:
             try:
-                send_mail(
+                # Queue the email so the SMTP round-trip doesn't block this request
+                send_email_task.delay(
                     subject,
                     message_body, # Use the pre-populated message body
                     settings.DEFAULT_FROM_EMAIL,
                     [recipient_email],  # Send to the requester's email address
-                    fail_silently=False,
                 )
-                messages.success(request, "Donor details sent successfully to the requester via email.")
+                messages.success(request, "Donor details are being emailed to the requester.")
             except Exception as e:
-                messages.error(request, f"Failed to send donor details email: {e}")
+                messages.error(request, f"Failed to queue donor details email: {e}")
                 print(f"Error sending email to requester: {e}") # For debugging
         else:
             messages.warning(request, "Requester does not have a valid email address linked to their account. Email notification not sent.")
             
-        return redirect('dashboard')
+        return redirect_to_dashboard(request)
 
     # On GET request, render the form
     return render(request, 'main/send_donor_details_to_requester.html', {
@@ -527,16 +611,18 @@ def accept_request_view(request, request_id):
     """
     Marks a donation request as 'accepted' and notifies the requester.
     """
-    donation_request = get_object_or_404(DonationRequest, pk=request_id)
+    # Load only what the check, the status update and the notification need
+    donation_request = get_object_or_404(
+        DonationRequest.objects.select_related('donor').only(
+            'id', 'requester', 'donor', 'donor__id', 'donor__name', 'donor__phone', 'donor__user'
+        ),
+        pk=request_id
+    )
 
     # Security Check: Ensure the logged-in user is the intended donor
-    if request.user != donation_request.donor.user:
+    if request.user.pk != donation_request.donor.user_id:
         messages.error(request, "You are not authorized to perform this action.")
-        return redirect('dashboard')
-
-    # Update the status
-    donation_request.status = 'accepted'
-    donation_request.save()
+        return redirect_to_dashboard(request)
 
     # Create a notification for the requester with the donor's details
     message_to_requester = (
@@ -544,14 +630,20 @@ def accept_request_view(request, request_id):
         f"You can contact them using the details below to coordinate:\n\n"
         f"Phone: {donation_request.donor.phone}"
     )
-    Notification.objects.create(
-        requester=donation_request.requester,
-        donor=donation_request.donor,
-        message=message_to_requester
-    )
+
+    # Status update and notification are committed together
+    with transaction.atomic():
+        # UPDATE only status/read_at; acting on a request also marks it as read
+        DonationRequest.objects.filter(pk=donation_request.pk).update(status='accepted', read_at=timezone.now())
+
+        Notification.objects.create(
+            requester_id=donation_request.requester_id,
+            donor_id=donation_request.donor_id,
+            message=message_to_requester
+        )
 
     messages.success(request, "Request accepted! The requester has been notified with your contact details.")
-    return redirect('dashboard')
+    return redirect_to_dashboard(request)
 
 
 @login_required
@@ -559,16 +651,19 @@ def reject_request_view(request, request_id):
     """
     Marks a donation request as 'rejected'.
     """
-    donation_request = get_object_or_404(DonationRequest, pk=request_id)
+    # Load only what the check and the status update need
+    donation_request = get_object_or_404(
+        DonationRequest.objects.select_related('donor').only('id', 'donor', 'donor__id', 'donor__user'),
+        pk=request_id
+    )
 
     # Security Check: Ensure the logged-in user is the intended donor
-    if request.user != donation_request.donor.user:
+    if request.user.pk != donation_request.donor.user_id:
         messages.error(request, "You are not authorized to perform this action.")
-        return redirect('dashboard')
+        return redirect_to_dashboard(request)
 
-    # Update the status
-    donation_request.status = 'rejected'
-    donation_request.save()
+    # Update the status; acting on a request also marks it as read
+    DonationRequest.objects.filter(pk=donation_request.pk).update(status='rejected', read_at=timezone.now())
     
     messages.info(request, "You have rejected the donation request.")
-    return redirect('dashboard')
\ No newline at end of file
+    return redirect_to_dashboard(request)
\ No newline at end of file